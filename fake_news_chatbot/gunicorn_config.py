@@ -0,0 +1,50 @@
+"""
+Gunicorn configuration for the Fake News Detection API.
+
+Usage (from the fake_news_chatbot directory):
+    gunicorn -c gunicorn_config.py
+"""
+
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Serve the Flask app defined in app/server.py
+chdir = os.path.join(BASE_DIR, "app")
+wsgi_app = "server:app"
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:5000")
+
+# A CUDA build of PaddlePaddle loads its own OCR model onto the GPU in every
+# worker (see ocr_service), so it defaults to a single worker
+try:
+    import paddle
+    _cuda = paddle.is_compiled_with_cuda()
+except ImportError:
+    _cuda = False
+
+# Threaded workers: requests in a worker share one model and one prediction batcher.
+# Few workers with many threads keep concurrent requests in the same batcher, where
+# they are grouped into one model call; scale out with GUNICORN_WORKERS if needed.
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", 1 if _cuda else 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Load the model and OCR pipeline once in the master before forking, so workers
+# share their memory copy-on-write instead of each loading their own copy
+preload_app = True
+
+# OCR on large images can take well over the default 30 seconds
+timeout = 120
+
+# Optionally pin each worker to a single CPU to reduce cache thrashing (Linux only)
+pin_workers = os.environ.get("GUNICORN_PIN_WORKERS") == "1"
+
+
+def post_fork(server, worker):
+    """Pin the new worker to a CPU when GUNICORN_PIN_WORKERS=1."""
+    if pin_workers and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        cpu = cpus[worker.age % len(cpus)]
+        os.sched_setaffinity(0, {cpu})
+        server.log.info(f"Pinned worker {worker.pid} to CPU {cpu}")
@@ -0,0 +1,169 @@
+"""
+Micro-batching queue for fake news model predictions.
+
+Concurrent requests are collected for a short window and classified with a
+single model call, so the TF-IDF + classifier pipeline runs once per batch
+instead of once per request.
+
+Also provides the worker-thread and batch-collection helpers shared with the
+pipelined OCR service.
+"""
+
+import os
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import Future
+
+from predict import classify_features
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of texts classified in a single model call
+MAX_BATCH_SIZE = int(os.environ.get('PREDICT_MAX_BATCH_SIZE', 64))
+
+# Maximum time (in seconds) to wait for more requests before running a batch
+MAX_BATCH_WAIT = float(os.environ.get('PREDICT_MAX_BATCH_WAIT', 0.005))
+
+
+class LazyDaemonThreads:
+    """
+    Set of named daemon worker threads started on first use.
+
+    Threads are started lazily so that an object created before a fork
+    (e.g. in a preloaded WSGI master) still gets its workers in each child.
+    """
+
+    def __init__(self, targets):
+        """
+        Args:
+            targets: Sequence of (thread name, callable) pairs
+        """
+        self._targets = tuple(targets)
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start any worker thread that is not running."""
+        if len(self._threads) == len(self._targets) and all(t.is_alive() for t in self._threads.values()):
+            return
+        with self._lock:
+            for name, target in self._targets:
+                thread = self._threads.get(name)
+                if thread is None or not thread.is_alive():
+                    thread = threading.Thread(target=target, name=name, daemon=True)
+                    thread.start()
+                    self._threads[name] = thread
+
+
+def collect_batch(pending, max_batch_size, max_wait, wait_if_idle=True):
+    """
+    Block until at least one item is pending, then gather more until the
+    batch is full or `max_wait` seconds have passed.
+
+    Args:
+        pending (queue.Queue): Queue to take items from
+        max_batch_size (int): Maximum number of items in the batch
+        max_wait (float): Maximum time in seconds to wait for the batch to fill
+        wait_if_idle (bool): If False, a lone item (nothing else pending when it
+            is taken) is returned at once instead of waiting for company
+
+    Returns:
+        list: The collected items
+    """
+    items = [pending.get()]
+    if not wait_if_idle and pending.empty():
+        return items
+    deadline = time.monotonic() + max_wait
+    while len(items) < max_batch_size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            items.append(pending.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return items
+
+
+def claim(items):
+    """
+    Mark (payload, future) items as running, dropping requests whose callers
+    have already given up.
+
+    Args:
+        items: Iterable of (payload, future) tuples
+
+    Returns:
+        list: The (payload, future) tuples that are still wanted
+    """
+    return [(payload, future) for payload, future in items if future.set_running_or_notify_cancel()]
+
+
+class RequestQueue:
+    """
+    Queue that groups prediction requests into batches.
+
+    A daemon worker thread pulls pending texts off the queue, waits up to
+    `max_wait` seconds (or until `max_batch_size` texts are pending), then
+    classifies the whole batch at once. A lone text with nothing else pending
+    is classified immediately; texts arriving while a batch runs are grouped
+    into the next one.
+
+    The pipeline is split into its feature steps and final classifier, so the
+    TF-IDF transform runs once per batch; labels and probabilities then come
+    from predict.classify_features, the same path predict_batch uses.
+    """
+
+    def __init__(self, model, max_batch_size=MAX_BATCH_SIZE, max_wait=MAX_BATCH_WAIT):
+        """
+        Args:
+            model: Trained sklearn Pipeline ending in a probabilistic classifier
+            max_batch_size (int): Maximum number of texts per model call
+            max_wait (float): Maximum time in seconds to wait for a batch to fill
+        """
+        self.model = model
+        self.vectorizer = model[:-1]
+        self.classifier = model[-1]
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._workers = LazyDaemonThreads([("prediction-batcher", self._run)])
+
+    def submit(self, text):
+        """
+        Submit a text for classification.
+
+        Args:
+            text (str): The news text to analyze
+
+        Returns:
+            Future: Resolves to a (prediction, probabilities) tuple for the text,
+                where probabilities is a list of per-class probabilities
+        """
+        self._workers.ensure_started()
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self):
+        """Worker loop: classify pending requests in batches."""
+        while True:
+            items = claim(collect_batch(self._queue, self.max_batch_size, self.max_wait, wait_if_idle=False))
+            if not items:
+                continue
+
+            texts = [text for text, _ in items]
+            try:
+                features = self.vectorizer.transform(texts)
+                predictions, probabilities = classify_features(self.classifier, features)
+            except Exception as e:
+                logger.error(f"Batch prediction failed: {e}")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+
+            # Convert to native Python types so results are JSON-serializable
+            for (_, future), prediction, proba in zip(items, predictions.tolist(), probabilities.tolist()):
+                future.set_result((prediction, proba))
@@ -0,0 +1,131 @@
+"""
+Result cache for model predictions and OCR output.
+
+Uses Redis when REDIS_URL is configured, so cached results are shared across
+worker processes. Otherwise falls back to a bounded in-process LRU cache.
+"""
+
+import os
+import time
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+
+import orjson
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Redis connection URL (e.g. "redis://localhost:6379/0"); in-process cache if unset
+REDIS_URL = os.environ.get('REDIS_URL')
+
+# Seconds to wait for Redis to connect or answer before falling back to a miss
+REDIS_TIMEOUT = float(os.environ.get('REDIS_TIMEOUT', 0.1))
+
+# Maximum number of entries kept by the in-process fallback cache
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 4096))
+
+
+def text_key(text, model_version):
+    """
+    Build the cache key for a prediction on the given text.
+
+    Args:
+        text (str): The news text to analyze
+        model_version (str): Fingerprint of the model making the prediction, so
+            predictions cached before a retrain are not served by the new model
+
+    Returns:
+        str: Cache key based on the model version and the SHA-256 of the normalized text
+    """
+    normalized = text.strip().lower()
+    return f"fn:{model_version}:" + hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def image_key(image_bytes):
+    """
+    Build the cache key for OCR output on the given image.
+
+    Args:
+        image_bytes (bytes): Raw encoded image bytes
+
+    Returns:
+        str: Cache key based on a 128-bit BLAKE2b digest of the image bytes
+    """
+    return "ocr:" + hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """
+    Key/value cache storing JSON-serializable values with a time-to-live.
+    """
+
+    def __init__(self, redis_url=REDIS_URL, max_entries=CACHE_MAX_ENTRIES, timeout=REDIS_TIMEOUT):
+        """
+        Args:
+            redis_url (str): Redis connection URL, or None to use the in-process cache
+            max_entries (int): Maximum number of entries in the in-process cache
+            timeout (float): Redis connect/read timeout in seconds; an unreachable
+                Redis then fails fast and is treated as a cache miss
+        """
+        self._redis = redis.Redis.from_url(
+            redis_url, socket_timeout=timeout, socket_connect_timeout=timeout
+        ) if redis_url else None
+        self._max_entries = max_entries
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Look up a cached value.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            The cached value, or None on a miss or cache error
+        """
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+            except redis.RedisError as e:
+                logger.warning(f"Cache lookup failed: {e}")
+                return None
+        else:
+            with self._lock:
+                entry = self._local.get(key)
+                if entry is None:
+                    return None
+                raw, expires_at = entry
+                if expires_at < time.monotonic():
+                    del self._local[key]
+                    return None
+                self._local.move_to_end(key)
+
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+    def set(self, key, value, ttl):
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value
+            ttl (int): Time-to-live in seconds
+        """
+        raw = orjson.dumps(value)
+        if self._redis is not None:
+            try:
+                self._redis.setex(key, ttl, raw)
+            except redis.RedisError as e:
+                logger.warning(f"Cache store failed: {e}")
+            return
+
+        with self._lock:
+            self._local[key] = (raw, time.monotonic() + ttl)
+            self._local.move_to_end(key)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
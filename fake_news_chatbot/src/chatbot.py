@@ -4,13 +4,29 @@ import os
 # Add src directory to path to import predict module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
+
 from predict import analyze_news
 
+# Input history is kept across sessions in the project root
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(BASE_DIR, ".chatbot_history")
+
+# Load the model and warm up the pipeline before the first prompt
+try:
+    analyze_news("warmup")
+except Exception as e:
+    print(f"Error: {e}")
+    sys.exit(1)
+
+session = PromptSession(history=FileHistory(HISTORY_PATH))
+
 print("🔥 Fake News Chatbot Ready! Type 'exit' to quit.\n")
 
 while True:
     try:
-        user_input = input("Enter a news sentence: ")
+        user_input = session.prompt("Enter a news sentence: ")
 
         if user_input.lower() == "exit":
             print("Goodbye!")
@@ -24,7 +40,8 @@ while True:
         print(f"\nAnalysis: {output['result']}")
         print(f"Confidence: {output['confidence']}%\n")
     
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
+        # Ctrl-C or Ctrl-D
         print("\n\nGoodbye!")
         break
     except Exception as e:
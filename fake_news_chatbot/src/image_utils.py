@@ -2,69 +2,112 @@
 Image utility functions for handling image processing and validation.
 """
 
-import base64
-import io
-from PIL import Image
+import pybase64
+import cv2
+import numpy as np
 
+# Magic bytes of image formats supported by OpenCV's decoder, checked with a
+# single bytes.startswith() call in validate_image()
+_IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',          # JPEG
+    b'\x89PNG\r\n\x1a\n',     # PNG
+    b'BM',                    # BMP
+    b'GIF87a',                # GIF
+    b'GIF89a',                # GIF
+    b'II*\x00',               # TIFF (little-endian)
+    b'MM\x00*',               # TIFF (big-endian)
+    b'RIFF',                  # RIFF container; WEBP tag checked separately
+)
 
-def base64_to_image(base64_string):
+
+def base64_to_bytes(base64_string):
     """
-    Convert a base64-encoded string to a PIL Image object.
+    Decode a base64-encoded image string to raw image bytes.
     
     Args:
         base64_string: Base64-encoded image string (with or without data URI prefix)
         
     Returns:
-        PIL.Image: Image object
+        bytes: Encoded image bytes
         
     Raises:
-        ValueError: If the base64 string is invalid or image cannot be decoded
+        ValueError: If the base64 string is invalid
     """
     try:
         # Remove data URI prefix if present (e.g., "data:image/jpeg;base64,...")
-        if ',' in base64_string:
-            base64_string = base64_string.split(',')[1]
+        prefix, separator, payload = base64_string.partition(',')
+        if separator:
+            base64_string = payload
         
-        # Decode base64 string
-        image_data = base64.b64decode(base64_string)
+        # Decode base64 string (SIMD-accelerated)
+        return pybase64.b64decode(base64_string, validate=False)
+    except Exception as e:
+        raise ValueError(f"Failed to decode base64 image: {str(e)}")
+
+
+def bytes_to_image(image_data):
+    """
+    Decode raw image bytes to a BGR image array using OpenCV.
+    
+    Args:
+        image_data: Encoded image bytes (JPEG, PNG, ...)
         
-        # Open image from bytes
-        image = Image.open(io.BytesIO(image_data))
+    Returns:
+        numpy.ndarray: Image array of shape (height, width, 3) in BGR order
         
-        # Convert to RGB if necessary (handles RGBA, P, etc.)
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+    Raises:
+        ValueError: If the image cannot be decoded
+    """
+    buffer = np.frombuffer(image_data, np.uint8)
+    # IMREAD_COLOR always yields 3-channel BGR (handles grayscale, RGBA, palette, etc.)
+    image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode image data")
+    return image
+
+
+def downscale_image(image, max_side):
+    """
+    Shrink an image so its longer side is at most `max_side` pixels.
+    
+    Uses area interpolation, which averages source pixels and keeps text legible.
+    Images already within the bound are returned unchanged.
+    
+    Args:
+        image: Image array of shape (height, width, channels)
+        max_side (int): Maximum length of the longer side in pixels
         
-        return image
-    except Exception as e:
-        raise ValueError(f"Failed to decode base64 image: {str(e)}")
+    Returns:
+        tuple: (image, scale) where scale is the applied resize factor (1.0 if unchanged)
+    """
+    height, width = image.shape[:2]
+    scale = max_side / max(height, width)
+    if scale >= 1:
+        return image, 1.0
+    
+    new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return cv2.resize(image, new_size, interpolation=cv2.INTER_AREA), scale
 
 
-def validate_image(image):
+def validate_image(image_data):
     """
-    Validate that an image is in a supported format and has valid properties.
+    Validate that encoded image bytes are in a format supported for decoding.
+    
+    Only the file signature is checked; the image is decoded once, later,
+    by the OCR service.
     
     Args:
-        image: PIL Image object
+        image_data: Encoded image bytes
         
     Returns:
         bool: True if image is valid, False otherwise
     """
-    if not isinstance(image, Image.Image):
-        return False
-    
-    # Check if image has valid size
-    if image.size[0] <= 0 or image.size[1] <= 0:
+    if not isinstance(image_data, (bytes, bytearray)):
         return False
     
-    # Check if image format is supported
-    # PIL supports many formats, but we'll check for common ones
-    try:
-        # Check if image has valid mode
-        if image.mode not in ['1', 'L', 'P', 'RGB', 'RGBA', 'CMYK', 'YCbCr', 'LAB', 'HSV', 'I', 'F']:
-            return False
-    except Exception:
+    # One C-level prefix test against every supported signature
+    if not image_data.startswith(_IMAGE_SIGNATURES):
         return False
     
-    return True
-
+    # A RIFF container is only supported when it holds WebP
+    return not image_data.startswith(b'RIFF') or image_data[8:12] == b'WEBP'
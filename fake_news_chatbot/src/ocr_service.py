@@ -1,15 +1,20 @@
 """
 OCR service using PaddleOCR for text extraction from images.
-Adapted from newsModel/extractor.py to work with PIL Images.
+Adapted from newsModel/extractor.py to work with decoded image arrays.
 """
 
 import os
 import re
-import tempfile
+import queue
 import logging
-from PIL import Image
+import warnings
+from concurrent.futures import Future
+import paddle
 from paddleocr import PaddleOCRVL
 
+from batching import LazyDaemonThreads, collect_batch, claim
+from image_utils import bytes_to_image, downscale_image
+
 # Bypass connectivity check to speed up initialization
 os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'
 
@@ -20,6 +25,37 @@ logging.getLogger('paddlex').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Images are downscaled so their longer side is at most this many pixels before OCR
+MAX_OCR_SIDE = int(os.environ.get('MAX_OCR_SIDE', 1600))
+
+# Maximum number of images passed to PaddleOCR in a single predict call
+OCR_MAX_BATCH_SIZE = int(os.environ.get('OCR_MAX_BATCH_SIZE', 4))
+
+# Maximum time (in seconds) to wait for a batch to fill while other images are queued
+OCR_MAX_BATCH_WAIT = float(os.environ.get('OCR_MAX_BATCH_WAIT', 0.2))
+
+# Capacity of each queue between the decode, OCR and post-processing stages
+OCR_QUEUE_SIZE = int(os.environ.get('OCR_QUEUE_SIZE', 8))
+
+# Defer PaddleOCR initialization to the first OCR request (e.g. for faster development restarts)
+LAZY_OCR_INIT = os.environ.get('LAZY_OCR_INIT') == '1'
+
+# Languages reported by get_supported_languages(). PaddleOCR supports many
+# languages, but we'll return a common subset; the actual language support
+# depends on the installed PaddleOCR models
+_SUPPORTED_LANGUAGES = (
+    'en',  # English
+    'ch',  # Chinese
+    'fr',  # French
+    'de',  # German
+    'es',  # Spanish
+    'it',  # Italian
+    'pt',  # Portuguese
+    'ru',  # Russian
+    'ja',  # Japanese
+    'ko',  # Korean
+)
+
 # Global pipeline instance (singleton pattern)
 _pipeline = None
 
@@ -54,6 +90,67 @@ def _get_pipeline():
     return _pipeline
 
 
+# Initialize the pipeline on import, so a preloaded gunicorn master loads the
+# OCR model once and forked workers share its memory copy-on-write.
+# Skipped on CUDA builds of Paddle: a CUDA context created before fork() is
+# unusable in the child processes, so each worker initializes its own.
+# Errors are logged and raised again by the first OCR request.
+if not LAZY_OCR_INIT and not paddle.is_compiled_with_cuda():
+    try:
+        _get_pipeline()
+    except Exception:
+        pass
+
+
+# Attribute names tried, in order, for the label and content of PaddleOCRVLBlock objects
+_LABEL_ATTRS = ('block_label', 'label', 'type')
+_CONTENT_ATTRS = ('block_content', 'content', 'text')
+
+# Words that mark a title block as the newspaper's name, matched in one regex scan
+_NAME_TOKENS = ('TIMES', 'POST', 'NEWS', 'JOURNAL', 'TRIBUNE', 'HERALD')
+_NAME_RE = re.compile('|'.join(_NAME_TOKENS))
+
+# Date patterns, tried in order of specificity
+_DATE_PATTERNS = (
+    re.compile(r'([A-Z]+DAY,\s+[A-Z]+\s+\d{1,2},\s+\d{4})'),  # WEDNESDAY, AUGUST 25, 2010
+    re.compile(r'([A-Z]+\s+\d{1,2},\s+\d{4})'),  # AUGUST 25, 2010
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{4})'),  # 08/25/2010
+)
+
+# Sentinel for attribute lookups, so a missing attribute costs a single getattr
+_MISSING = object()
+
+
+def _first_attr(obj, names):
+    """
+    Return the value of the first attribute in `names` that `obj` has, or None.
+    """
+    for name in names:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return None
+
+
+def _extract_pair(block):
+    """
+    Normalize a parsed block into its label and content.
+    
+    Args:
+        block: Parsed block, either a dictionary or a PaddleOCRVLBlock object
+        
+    Returns:
+        tuple: (label, content) with content stripped ('' if missing)
+    """
+    # Handle both dictionary and PaddleOCRVLBlock object formats
+    if isinstance(block, dict):
+        return block.get('block_label', ''), (block.get('block_content', '') or '').strip()
+    
+    label = _first_attr(block, _LABEL_ATTRS)
+    content = _first_attr(block, _CONTENT_ATTRS)
+    return ('' if label is None else label), (str(content).strip() if content else '')
+
+
 def format_newspaper_structure(parsing_res_list):
     """
     Format OCR results into a structured newspaper description.
@@ -73,55 +170,22 @@ def format_newspaper_structure(parsing_res_list):
     website_info = None
     
     # Extract information from parsing results
-    for block in parsing_res_list:
-        # Handle both dictionary and PaddleOCRVLBlock object formats
-        if isinstance(block, dict):
-            label = block.get('block_label', '')
-            content = block.get('block_content', '').strip()
-        else:
-            # Handle PaddleOCRVLBlock object
-            # Try to get label and content from object attributes
-            label = ''
-            content = ''
-            
-            # Try common attribute names
-            if hasattr(block, 'block_label'):
-                label = block.block_label
-            elif hasattr(block, 'label'):
-                label = block.label
-            elif hasattr(block, 'type'):
-                label = block.type
-            
-            if hasattr(block, 'block_content'):
-                content = block.block_content
-            elif hasattr(block, 'content'):
-                content = block.content
-            elif hasattr(block, 'text'):
-                content = block.text
-            
-            # Convert to string and strip
-            if content:
-                content = str(content).strip()
-        
+    for label, content in map(_extract_pair, parsing_res_list):
         if not content:
             continue
+        content_upper = content.upper()
             
         # Extract newspaper name (usually paragraph_title at top)
         if label == 'paragraph_title' and not newspaper_name:
             # Check if it looks like a newspaper name
-            if any(word in content.upper() for word in ['TIMES', 'POST', 'NEWS', 'JOURNAL', 'TRIBUNE', 'HERALD']):
+            if _NAME_RE.search(content_upper):
                 newspaper_name = content
         
         # Extract date (usually in text blocks with date-like patterns)
         if not date and label == 'text':
             # Look for date patterns
-            date_patterns = [
-                r'([A-Z]+DAY,\s+[A-Z]+\s+\d{1,2},\s+\d{4})',  # WEDNESDAY, AUGUST 25, 2010
-                r'([A-Z]+\s+\d{1,2},\s+\d{4})',  # AUGUST 25, 2010
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # 08/25/2010
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, content)
+            for pattern in _DATE_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     date = match.group(1)
                     break
@@ -139,11 +203,12 @@ def format_newspaper_structure(parsing_res_list):
             section_labels.append(content)
         
         # Extract weather info
-        if 'SHOWER' in content.upper() or 'HIGH' in content.upper() or 'LOW' in content.upper():
+        if 'SHOWER' in content_upper or 'HIGH' in content_upper or 'LOW' in content_upper:
             weather_info = content
         
         # Extract website info
-        if '.com' in content.lower() or 'www.' in content.lower():
+        content_lower = content.lower()
+        if '.com' in content_lower or 'www.' in content_lower:
             website_info = content
     
     # Build structured description
@@ -219,6 +284,8 @@ def _extract_raw_text_from_results(results):
     
     if isinstance(results, list):
         for res in results:
+            sources_before = len(all_text_sources)
+            
             # Extract from parsing_res_list (most important source)
             if hasattr(res, 'get'):
                 try:
@@ -247,31 +314,25 @@ def _extract_raw_text_from_results(results):
                 except Exception as e:
                     logger.debug(f"Error extracting from parsing_res_list: {e}")
             
-            # Extract from markdown property
-            if hasattr(res, 'markdown'):
-                try:
-                    md = res.markdown
-                    if callable(md):
-                        md = md()
-                    if md and isinstance(md, str) and md.strip():
-                        input_path = res.get('input_path', '') if hasattr(res, 'get') else ''
-                        if md.strip() != input_path and len(md.strip()) > 10:
-                            all_text_sources.append(md.strip())
-                except Exception as e:
-                    logger.debug(f"Error accessing markdown: {e}")
+            # The markdown and str renderings below only repeat the parsed blocks,
+            # and producing them can re-serialize the whole document; use them
+            # only as fallbacks when parsing_res_list yielded no text
+            if len(all_text_sources) > sources_before:
+                continue
             
-            # Extract from str property
-            if hasattr(res, 'str'):
+            # Extract from markdown and str properties (a single getattr each:
+            # hasattr would evaluate a rendering property one extra time)
+            for attr_name in ('markdown', 'str'):
                 try:
-                    str_val = res.str
-                    if callable(str_val):
-                        str_val = str_val()
-                    if str_val and isinstance(str_val, str) and str_val.strip():
+                    rendered = getattr(res, attr_name, None)
+                    if callable(rendered):
+                        rendered = rendered()
+                    if rendered and isinstance(rendered, str) and rendered.strip():
                         input_path = res.get('input_path', '') if hasattr(res, 'get') else ''
-                        if str_val.strip() != input_path and len(str_val.strip()) > 10:
-                            all_text_sources.append(str_val.strip())
+                        if rendered.strip() != input_path and len(rendered.strip()) > 10:
+                            all_text_sources.append(rendered.strip())
                 except Exception as e:
-                    logger.debug(f"Error accessing str: {e}")
+                    logger.debug(f"Error accessing {attr_name}: {e}")
     
     elif isinstance(results, dict):
         # Handle dictionary results
@@ -289,13 +350,8 @@ def _extract_raw_text_from_results(results):
         if results.strip():
             all_text_sources.append(results.strip())
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_texts = []
-    for text in all_text_sources:
-        if text not in seen:
-            seen.add(text)
-            unique_texts.append(text)
+    # Remove duplicates while preserving order (single C-level pass; str hashes are cached)
+    unique_texts = list(dict.fromkeys(all_text_sources))
     
     # Combine all unique texts
     if unique_texts:
@@ -304,145 +360,277 @@ def _extract_raw_text_from_results(results):
     return ""
 
 
-def extract_text(image, language_hints=None):
+def _prepare_image(image_bytes):
     """
-    Extract text from a PIL Image using PaddleOCR.
+    Decode encoded image bytes and cap their resolution for OCR.
     
     Args:
-        image: PIL Image object
-        language_hints: Optional list of language codes (not used by PaddleOCR, kept for API compatibility)
+        image_bytes: Encoded image bytes (JPEG, PNG, ...)
         
     Returns:
-        tuple: (raw_text, structured_text, metadata)
-            - raw_text: Extracted raw text for model prediction
-            - structured_text: Formatted newspaper description (or empty string if not applicable)
-            - metadata: Dictionary with OCR metadata
+        tuple: (image, scale) - BGR image array and the downscale factor applied
+        
+    Raises:
+        ValueError: If the image cannot be decoded
     """
-    pipeline = _get_pipeline()
+    # Decode to a BGR array, the input format PaddleOCR uses internally
+    image = bytes_to_image(image_bytes)
     
-    # Save image to temporary file for PaddleOCR processing
-    temp_file = None
-    try:
-        # Create temporary file
-        temp_fd, temp_file = tempfile.mkstemp(suffix='.jpg')
-        os.close(temp_fd)
-        
-        # Save PIL image to temporary file
-        image.save(temp_file, 'JPEG', quality=95)
+    # OCR cost grows with pixel count; cap the resolution of very large images
+    image, scale = downscale_image(image, MAX_OCR_SIDE)
+    if scale < 1:
+        logger.info(f"Downscaled image by {scale:.3f} for OCR")
+    return image, scale
+
+
+def _predict_quietly(pipeline, inputs, level=logging.ERROR):
+    """
+    Run PaddleOCR with its internal logging and warnings suppressed.
+    
+    Args:
+        pipeline: Initialized PaddleOCRVL instance
+        inputs: Image array, or list of image arrays
+        level: Logging level applied to PaddleOCR loggers during prediction
         
-        # Process the image
-        logger.info("Processing image with PaddleOCR...")
-        # Suppress PaddleOCR internal logging during prediction to avoid Tensor conversion errors
-        import warnings
-        import paddle
+    Returns:
+        list: PaddleOCR results, one per input image
+    """
+    # Suppress PaddleOCR internal logging during prediction to avoid Tensor conversion errors
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        # Temporarily reduce logging level for all loggers
+        old_levels = {}
+        for logger_name in ['paddle', 'ppocr', 'paddlex', 'root']:
+            logger_obj = logging.getLogger(logger_name)
+            old_levels[logger_name] = logger_obj.level
+            logger_obj.setLevel(level)
         
-        # Try to enable dynamic mode if available
         try:
-            if hasattr(paddle, 'enable_static'):
-                # Disable static mode if possible
-                pass
-        except:
-            pass
-        
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # Temporarily reduce logging level for all loggers
-            old_levels = {}
-            for logger_name in ['paddle', 'ppocr', 'paddlex', 'root']:
-                logger_obj = logging.getLogger(logger_name)
-                old_levels[logger_name] = logger_obj.level
-                logger_obj.setLevel(logging.ERROR)
-            
-            try:
-                results = pipeline.predict(temp_file)
-            finally:
-                # Restore logging levels
-                for logger_name, old_level in old_levels.items():
-                    logging.getLogger(logger_name).setLevel(old_level)
-        
-        logger.info("OCR prediction completed")
-        
-        # Extract parsing_res_list for structured formatting
-        parsing_res_list = None
-        if isinstance(results, list) and len(results) > 0:
-            res = results[0]
-            if hasattr(res, 'get'):
-                parsing_res_list = res.get('parsing_res_list')
-        
-        # Extract raw text
-        raw_text = _extract_raw_text_from_results(results)
-        
-        # Generate structured text if parsing_res_list is available
-        structured_text = ""
-        if parsing_res_list:
-            try:
-                structured_text = format_newspaper_structure(parsing_res_list)
-            except Exception as e:
-                logger.warning(f"Error generating structured text: {e}")
-                structured_text = ""
-        
-        # Build metadata
-        metadata = {
-            'engine': 'paddleocr',
-            'text_detections': len(raw_text.split('\n')) if raw_text else 0,
-            'has_structured_format': bool(structured_text)
-        }
+            return pipeline.predict(inputs)
+        finally:
+            # Restore logging levels
+            for logger_name, old_level in old_levels.items():
+                logging.getLogger(logger_name).setLevel(old_level)
+
+
+def _predict_image(pipeline, image):
+    """
+    Run OCR on a single image, retrying once on PaddleOCR's Tensor conversion error.
+    
+    Args:
+        pipeline: Initialized PaddleOCRVL instance
+        image: BGR image array
         
-        return raw_text, structured_text, metadata
+    Returns:
+        list: PaddleOCR results for the image
         
+    Raises:
+        Exception: If OCR extraction fails
+    """
+    try:
+        return _predict_quietly(pipeline, image)
     except Exception as e:
         error_msg = str(e)
         # Check if it's the Tensor conversion error
         if "int(Tensor)" in error_msg or "static graph mode" in error_msg:
             logger.warning("PaddleOCR Tensor conversion error detected. Retrying with minimal logging...")
-            # Try once more with minimal logging - ensure temp_file and pipeline are still available
-            if temp_file and os.path.exists(temp_file) and pipeline:
-                try:
-                    import warnings
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        # Set all relevant loggers to CRITICAL
-                        for logger_name in ['paddle', 'ppocr', 'paddlex', 'root']:
-                            logging.getLogger(logger_name).setLevel(logging.CRITICAL)
-                        
-                        results = pipeline.predict(temp_file)
-                        raw_text = _extract_raw_text_from_results(results)
-                        
-                        # Extract parsing_res_list
-                        parsing_res_list = None
-                        if isinstance(results, list) and len(results) > 0:
-                            res = results[0]
-                            if hasattr(res, 'get'):
-                                parsing_res_list = res.get('parsing_res_list')
-                        
-                        structured_text = ""
-                        if parsing_res_list:
-                            try:
-                                structured_text = format_newspaper_structure(parsing_res_list)
-                            except:
-                                structured_text = ""
-                        
-                        metadata = {
-                            'engine': 'paddleocr',
-                            'text_detections': len(raw_text.split('\n')) if raw_text else 0,
-                            'has_structured_format': bool(structured_text)
-                        }
-                        
-                        return raw_text, structured_text, metadata
-                except Exception as retry_error:
-                    logger.error(f"OCR extraction failed even after retry: {retry_error}")
-                    raise Exception(f"OCR extraction failed: {str(retry_error)}")
+            try:
+                return _predict_quietly(pipeline, image, level=logging.CRITICAL)
+            except Exception as retry_error:
+                logger.error(f"OCR extraction failed even after retry: {retry_error}")
+                raise Exception(f"OCR extraction failed: {str(retry_error)}")
         
         logger.error(f"OCR extraction failed: {e}")
         raise Exception(f"OCR extraction failed: {str(e)}")
+
+
+def _build_result(results, scale):
+    """
+    Turn PaddleOCR results for one image into the value returned by extract_text().
+    
+    Args:
+        results: PaddleOCR results for the image
+        scale (float): Downscale factor applied before OCR
+        
+    Returns:
+        tuple: (raw_text, structured_text, metadata)
+    """
+    # Extract parsing_res_list for structured formatting
+    parsing_res_list = None
+    if isinstance(results, list) and len(results) > 0:
+        res = results[0]
+        if hasattr(res, 'get'):
+            parsing_res_list = res.get('parsing_res_list')
+    
+    # Extract raw text
+    raw_text = _extract_raw_text_from_results(results)
+    
+    # Generate structured text if parsing_res_list is available
+    structured_text = ""
+    if parsing_res_list:
+        try:
+            structured_text = format_newspaper_structure(parsing_res_list)
+        except Exception as e:
+            logger.warning(f"Error generating structured text: {e}")
+            structured_text = ""
+    
+    # Build metadata
+    metadata = {
+        'engine': 'paddleocr',
+        'text_detections': len(raw_text.split('\n')) if raw_text else 0,
+        'has_structured_format': bool(structured_text),
+        'scale': scale
+    }
+    
+    return raw_text, structured_text, metadata
+
+
+class BatchingOCRService:
+    """
+    Pipelined OCR service that overlaps decoding, recognition and post-processing.
+    
+    Three daemon worker threads exchange work through bounded queues: the
+    decode stage turns image bytes into downscaled arrays, the OCR stage runs
+    PaddleOCR on mini-batches of arrays, and the post-processing stage builds
+    the raw and structured text. The next image is decoded while the current
+    one is being recognized, and concurrent requests share predict calls.
+    
+    An image that arrives while the OCR stage is idle is processed at once.
+    When more images are queued, the OCR stage gathers up to `max_batch_size`
+    of them, waiting at most `max_wait` seconds for the batch to fill.
+    """
+    
+    def __init__(self, max_batch_size=OCR_MAX_BATCH_SIZE, max_wait=OCR_MAX_BATCH_WAIT,
+                 queue_size=OCR_QUEUE_SIZE):
+        """
+        Args:
+            max_batch_size (int): Maximum number of images per PaddleOCR call
+            max_wait (float): Maximum time in seconds to wait for a batch to fill
+            queue_size (int): Capacity of each queue between stages
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._decode_q = queue.Queue(maxsize=queue_size)
+        self._ocr_q = queue.Queue(maxsize=queue_size)
+        self._post_q = queue.Queue(maxsize=queue_size)
+        self._workers = LazyDaemonThreads([
+            ('ocr-decode', self._decode_worker),
+            ('ocr-predict', self._ocr_worker),
+            ('ocr-postprocess', self._post_worker),
+        ])
+    
+    def submit(self, image_bytes):
+        """
+        Submit an image for text extraction.
+        
+        Blocks while the decode queue is full, which applies backpressure to callers.
+        
+        Args:
+            image_bytes: Encoded image bytes (JPEG, PNG, ...)
+            
+        Returns:
+            Future: Resolves to a (raw_text, structured_text, metadata) tuple
+        """
+        self._workers.ensure_started()
+        future = Future()
+        self._decode_q.put((image_bytes, future))
+        return future
+    
+    def _decode_worker(self):
+        """Decode stage: image bytes -> downscaled BGR arrays."""
+        while True:
+            for image_bytes, future in claim([self._decode_q.get()]):
+                try:
+                    image, scale = _prepare_image(image_bytes)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                self._ocr_q.put((future, image, scale))
     
-    finally:
-        # Clean up temporary file
-        if temp_file and os.path.exists(temp_file):
+    def _ocr_worker(self):
+        """OCR stage: run PaddleOCR on mini-batches of decoded images."""
+        while True:
+            items = collect_batch(self._ocr_q, self.max_batch_size, self.max_wait, wait_if_idle=False)
             try:
-                os.remove(temp_file)
+                pipeline = _get_pipeline()
             except Exception as e:
-                logger.warning(f"Failed to remove temporary file: {e}")
+                for future, _, _ in items:
+                    future.set_exception(e)
+                continue
+            
+            logger.info(f"Processing {len(items)} image(s) with PaddleOCR...")
+            batch_results = None
+            if len(items) > 1:
+                try:
+                    results = _predict_quietly(pipeline, [image for _, image, _ in items])
+                    if isinstance(results, list) and len(results) == len(items):
+                        batch_results = [[res] for res in results]
+                except Exception as e:
+                    logger.warning(f"Batched OCR failed, retrying images one at a time: {e}")
+            
+            for index, (future, image, scale) in enumerate(items):
+                try:
+                    results = batch_results[index] if batch_results is not None else _predict_image(pipeline, image)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                self._post_q.put((future, results, scale))
+            logger.info("OCR prediction completed")
+    
+    def _post_worker(self):
+        """Post-processing stage: PaddleOCR results -> raw and structured text."""
+        while True:
+            future, results, scale = self._post_q.get()
+            try:
+                future.set_result(_build_result(results, scale))
+            except Exception as e:
+                future.set_exception(e)
+
+
+# Global OCR service instance; its worker threads start on first use
+_service = BatchingOCRService()
+
+
+def extract_text(image_bytes, language_hints=None):
+    """
+    Extract text from an image using PaddleOCR.
+    
+    The image is decoded once with OpenCV and the resulting array is passed
+    to PaddleOCR directly, without an intermediate file. Work is handed to the
+    pipelined BatchingOCRService, so concurrent calls are batched together.
+    
+    Args:
+        image_bytes: Encoded image bytes (JPEG, PNG, ...)
+        language_hints: Optional list of language codes (not used by PaddleOCR, kept for API compatibility)
+        
+    Returns:
+        tuple: (raw_text, structured_text, metadata)
+            - raw_text: Extracted raw text for model prediction
+            - structured_text: Formatted newspaper description (or empty string if not applicable)
+            - metadata: Dictionary with OCR metadata (including the downscale factor applied)
+            
+    Raises:
+        ValueError: If the image cannot be decoded
+        Exception: If OCR extraction fails
+    """
+    return submit_extract_text(image_bytes).result()
+
+
+def submit_extract_text(image_bytes):
+    """
+    Queue an image for text extraction without waiting for the result.
+    
+    Submitting several images before waiting lets the OCR service decode,
+    recognize and post-process them concurrently, batching PaddleOCR calls.
+    
+    Args:
+        image_bytes: Encoded image bytes (JPEG, PNG, ...)
+        
+    Returns:
+        Future: Resolves to the (raw_text, structured_text, metadata) tuple
+            returned by extract_text(), or raises its exceptions
+    """
+    return _service.submit(image_bytes)
 
 
 def get_supported_languages():
@@ -451,20 +639,6 @@ def get_supported_languages():
     Note: PaddleOCR supports many languages, but this is a simplified list.
     
     Returns:
-        list: List of supported language codes
+        tuple: Supported language codes (shared and immutable)
     """
-    # PaddleOCR supports many languages, but we'll return a common subset
-    # The actual language support depends on the installed PaddleOCR models
-    return [
-        'en',  # English
-        'ch',  # Chinese
-        'fr',  # French
-        'de',  # German
-        'es',  # Spanish
-        'it',  # Italian
-        'pt',  # Portuguese
-        'ru',  # Russian
-        'ja',  # Japanese
-        'ko',  # Korean
-    ]
-
+    return _SUPPORTED_LANGUAGES
@@ -0,0 +1,59 @@
+"""
+End-to-end batch pipeline: images -> OCR -> newspaper preprocessing -> prediction.
+"""
+
+import logging
+
+from ocr_service import submit_extract_text
+from preprocess import preprocess_newspaper_text
+from predict import predict_batch
+
+logger = logging.getLogger(__name__)
+
+
+def extract_and_predict_batch(images):
+    """
+    Extract text from several images and classify all of them with one model call.
+    
+    Every image is submitted to the OCR service up front, so decoding and
+    recognition overlap and images share PaddleOCR batches. The extracted
+    texts are then preprocessed and classified together by predict_batch().
+    
+    Args:
+        images (list): Encoded image bytes (JPEG, PNG, ...), one entry per image
+    
+    Returns:
+        list: One dictionary per image, in input order, with 'label' (FAKE/REAL),
+            'confidence' (percentage), 'extracted_text' and 'preprocessed_text',
+            or with 'error' if the image could not be processed
+    """
+    futures = [submit_extract_text(image_bytes) for image_bytes in images]
+    
+    results = []
+    for future in futures:
+        try:
+            extracted_text, _, _ = future.result()
+        except Exception as e:
+            logger.error(f"OCR extraction failed: {e}")
+            results.append({"error": f"OCR extraction failed: {str(e)}"})
+            continue
+        
+        # Preprocess OCR-extracted text to focus on meaningful news content
+        preprocessed_text = preprocess_newspaper_text(extracted_text)
+        if not preprocessed_text:
+            results.append({"error": "No meaningful text could be extracted from the image"})
+            continue
+        
+        results.append({
+            "extracted_text": extracted_text,
+            "preprocessed_text": preprocessed_text
+        })
+    
+    # Classify every image with text in a single batched model call
+    pending = [result for result in results if "error" not in result]
+    if pending:
+        predictions = predict_batch([result["preprocessed_text"] for result in pending])
+        for result, prediction in zip(pending, predictions):
+            result.update(prediction)
+    
+    return results
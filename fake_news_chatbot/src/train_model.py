@@ -1,11 +1,20 @@
+import os
+import tempfile
+import numpy as np
 import pandas as pd
-import re
+import scipy.sparse as sp
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import classification_report
 import joblib
+from joblib import Parallel, delayed, effective_n_jobs
+
+from preprocess import filter_letters
+
+# Number of processes used to tokenize and hash the corpus (-1 = all CPUs)
+N_JOBS = int(os.environ.get('TRAIN_N_JOBS', -1))
 
 # -----------------------------
 # 1. Load Dataset
@@ -19,15 +28,13 @@ real["label"] = 1  # 1 = real
 df = pd.concat([fake, real]).sample(frac=1).reset_index(drop=True)
 
 # -----------------------------
-# 2. Clean Text Function
+# 2. Clean Text
 # -----------------------------
-def clean_text(text):
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"[^A-Za-z ]", " ", text)
-    text = text.lower()
-    return text
-
-df["text"] = df["text"].apply(clean_text)
+# URLs are removed with one compiled regex over the whole column; the
+# letters-and-spaces filter + lowercasing is the same single-pass byte
+# translation used by preprocess.clean_text at inference time
+text = df["text"].astype(str).str.replace(r"http\S+", "", regex=True)
+df["text"] = text.map(filter_letters)
 
 X = df["text"]
 y = df["label"]
@@ -40,27 +47,68 @@ X_train, X_test, y_train, y_test = train_test_split(
 )
 
 # -----------------------------
-# 4. Pipeline = TF-IDF + Logistic Regression
+# 4. Pipeline = hashed TF-IDF + Logistic Regression
 # -----------------------------
-model = Pipeline([
-    ("tfidf", TfidfVectorizer(stop_words="english", max_features=50000)),
-    ("clf", LogisticRegression(max_iter=300)),
-])
+# The hashing step is stateless (no vocabulary to pickle or look up), so the
+# saved model holds only the IDF weights and classifier coefficients
+hasher = HashingVectorizer(stop_words="english", n_features=2**18, alternate_sign=False, norm=None)
+tfidf = TfidfTransformer()
+clf = LogisticRegression(max_iter=300)
+
+def hash_texts(texts):
+    """
+    Tokenize and hash texts into term counts, in parallel chunks.
+    
+    Tokenization dominates training time and the hasher is stateless, so
+    chunks can be hashed in separate processes and stacked back in order.
+    """
+    chunks = np.array_split(np.asarray(texts, dtype=object), effective_n_jobs(N_JOBS))
+    return sp.vstack(Parallel(n_jobs=N_JOBS)(delayed(hasher.transform)(chunk) for chunk in chunks))
 
 # -----------------------------
 # 5. Train
 # -----------------------------
-model.fit(X_train, y_train)
+clf.fit(tfidf.fit_transform(hash_texts(X_train)), y_train)
+
+# Store features, IDF weights and classifier weights as float32: halves the
+# model file and the memory traffic of inference, and lets the server
+# memory-map the weights as saved instead of downcasting a copy at load
+hasher.dtype = np.float32
+tfidf.idf_ = tfidf.idf_.astype(np.float32)
+clf.coef_ = clf.coef_.astype(np.float32)
+clf.intercept_ = clf.intercept_.astype(np.float32)
+
+model = Pipeline([
+    ("hasher", hasher),
+    ("tfidf", tfidf),
+    ("clf", clf),
+])
 
 # -----------------------------
 # 6. Evaluate
 # -----------------------------
-preds = model.predict(X_test)
+preds = clf.predict(tfidf.transform(hash_texts(X_test)))
 print(classification_report(y_test, preds))
 
 # -----------------------------
 # 7. Save Model
 # -----------------------------
-joblib.dump(model, "models/fake_news_model.pkl")
+# Saved uncompressed so the API server can memory-map the arrays (compression defeats mmap).
+# The model is written to a temporary file and renamed over the old one: running
+# servers keep their mapping of the old file, whereas truncating it in place would
+# crash them (SIGBUS) on their next prediction. mkstemp creates the file as 0600,
+# so it is given the usual umask-based mode to stay readable by a server running
+# as another user.
+fd, tmp_path = tempfile.mkstemp(dir="models", suffix=".pkl.tmp")
+os.close(fd)
+umask = os.umask(0)
+os.umask(umask)
+try:
+    joblib.dump(model, tmp_path, compress=0)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    os.replace(tmp_path, "models/fake_news_model.pkl")
+except BaseException:
+    os.remove(tmp_path)
+    raise
 
 print("Model trained and saved as models/fake_news_model.pkl")